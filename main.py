@@ -13,7 +13,7 @@ def main():
         if file.endswith(".pgn")
     ]
 
-    files.sort(key=lambda x: os.path.getsize(x), reverse=False)
+    files.sort(key=os.path.getsize)
 
     files = files[:10]  
 
@@ -21,16 +21,13 @@ def main():
 
     num_workers = (os.cpu_count() - 1) or 1  
     with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        for processed_games in tqdm(
-            executor.map(processor.process_file, files),
-            total=len(files),
-            desc="Processing files",
+        for dataset in tqdm(
+            processor.process_files(files, executor, max_pending=2 * num_workers),
+            desc="Processing game batches",
         ):
-            all_processed_games.extend(processed_games)
+            all_processed_games.extend(dataset)
 
-    data = [{"current_fen": fen, "serialized_board": serialized_board} for fen, serialized_board in all_processed_games]
-
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(all_processed_games, columns=["current_fen", "serialized_board"])
     print(len(df))
     df.to_csv("data/processed_games.csv", index=False)
     print("Disk size:", os.path.getsize("data/processed_games.csv"))
@@ -1,25 +1,86 @@
+from collections import OrderedDict
+
 import chess
 import chess.engine
+import chess.polyglot
+
+MAX_CACHE_SIZE = 100000
+MATE_SCORE = 10000
+
+# Shared by every Evaluator created with use_cache=True, keyed by
+# (engine_path, Zobrist hash, halfmove clock). The engine path keeps instances
+# on different engines apart; the clock matters because Stockfish damps scores
+# as the 50-move counter grows.
+_EVAL_CACHE = OrderedDict()
 
 class Evaluator:
-    def __init__(self, engine_path):
+    __slots__ = ("engine_path", "use_cache", "_engine")
+
+    def __init__(self, engine_path, use_cache=False):
         self.engine_path = engine_path
+        self.use_cache = use_cache
+        self._engine = None
+
+    def __enter__(self):
+        # Inside a with block one engine serves every call; outside it each
+        # call starts and stops its own engine.
+        if self._engine is None:
+            self._engine = chess.engine.SimpleEngine.popen_uci(self.engine_path)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        engine, self._engine = self._engine, None
+        if engine is None:
+            return
+        try:
+            engine.quit()
+        except chess.engine.EngineTerminatedError:
+            pass
 
     def evaluate_position(self, fen):
-        with chess.engine.SimpleEngine.popen_uci(self.engine_path) as engine:
-            board = chess.Board(fen)
-            info = engine.analyse(board, chess.engine.Limit(time=0.01))
-            score = info.get("score")
-
-            if score is None:
-                return 0
-
-            score_value = score.white()
-            if score_value.is_mate():
-                mate_in_moves = int(str(score_value).replace("#", ""))
-                return (
-                    10000 - (mate_in_moves * 100)
-                    if mate_in_moves > 0
-                    else -10000 + (-mate_in_moves * 100)
-                )
-            return int(str(score_value))
+        board = chess.Board(fen)
+        if not self.use_cache:
+            return self._analyse(board)
+
+        key = (self.engine_path, chess.polyglot.zobrist_hash(board), board.halfmove_clock)
+        if key in _EVAL_CACHE:
+            _EVAL_CACHE.move_to_end(key)
+            return _EVAL_CACHE[key]
+
+        score = self._analyse(board)
+
+        if len(_EVAL_CACHE) >= MAX_CACHE_SIZE:
+            _EVAL_CACHE.popitem(last=False)
+        _EVAL_CACHE[key] = score
+        return score
+
+    def _analyse(self, board):
+        limit = chess.engine.Limit(time=0.01)
+        if self._engine is None:
+            with chess.engine.SimpleEngine.popen_uci(self.engine_path) as engine:
+                info = engine.analyse(board, limit)
+        else:
+            try:
+                info = self._engine.analyse(board, limit)
+            except chess.engine.EngineTerminatedError:
+                # The engine died; replace it and retry once.
+                self.close()
+                self._engine = chess.engine.SimpleEngine.popen_uci(self.engine_path)
+                info = self._engine.analyse(board, limit)
+        score = info.get("score")
+
+        if score is None:
+            return 0
+
+        score_value = score.white()
+        mate_in_moves = score_value.mate()
+        if mate_in_moves is not None:
+            return (
+                MATE_SCORE - (mate_in_moves * 100)
+                if mate_in_moves > 0
+                else -MATE_SCORE + (-mate_in_moves * 100)
+            )
+        return score_value.score()
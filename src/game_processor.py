@@ -1,5 +1,12 @@
-import numpy as np
-from src.utils import convert_algebraic_to_san, convert_fen_to_bitboard, serialize_position
+import logging
+from collections import deque
+from itertools import chain, islice
+
+from src.utils import convert_algebraic_to_san, serialize_position
+
+logger = logging.getLogger(__name__)
+
+GAMES_PER_BATCH = 64
 
 class GameProcessor:
     def make_dataset(self, game):
@@ -13,27 +20,56 @@ class GameProcessor:
                 serialized_position = serialize_position(fen)
                 dataset.append((fen, serialized_position))
             except Exception as e:
-                print(f"Error serializing position for FEN {fen}: {e}")
+                logger.warning("Error serializing position for FEN %s: %s", fen, e)
                 continue  
 
         return dataset
 
     def process_game(self, file):
-        games = []
         try:
             with open(file, "r") as f:
-                game = f.read()
-            for g in game.split("\n\n"):
-                if g.startswith("1"):
-                    games.append(g)
+                block = []
+                for line in f:
+                    if line != "\n":
+                        block.append(line)
+                        continue
+                    game = "".join(block).rstrip("\n")
+                    block = []
+                    if game.startswith("1"):
+                        yield game
+                game = "".join(block).rstrip("\n")
+                if game.startswith("1"):
+                    yield game
         except Exception as e:
-            print(f"Error reading file: {file} - {e}")
-        return games
+            logger.warning("Error reading file: %s - %s", file, e)
 
-    def process_file(self, file):
-        processed_games = []
-        games = self.process_game(file)
+    def make_datasets(self, games):
+        dataset = []
         for game in games:
-            dataset = self.make_dataset(game)
+            dataset.extend(self.make_dataset(game))
+        return dataset
+
+    def process_files(self, files, executor=None, max_pending=8):
+        # Games from all files form one stream, cut into batches. With an
+        # executor, at most max_pending batches are in flight, so reading stays
+        # bounded and the pool is not drained between files. Batches are
+        # yielded in input order.
+        games = chain.from_iterable(map(self.process_game, files))
+        batches = iter(lambda: list(islice(games, GAMES_PER_BATCH)), [])
+        if executor is None:
+            yield from map(self.make_datasets, batches)
+            return
+
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(self.make_datasets, batch))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def process_file(self, file, executor=None):
+        processed_games = []
+        for dataset in self.process_files([file], executor):
             processed_games.extend(dataset)
         return processed_games
@@ -1,8 +1,26 @@
+import logging
+
 import chess
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+PIECES = ("p", "r", "n", "b", "q", "k")
+
+_SLASH = ord("/")
+_ZERO = ord("0")
+_NINE = ord("9")
+_NO_PIECE = 255
+# ASCII code -> slot in PIECES, _NO_PIECE for anything that is not tracked.
+_PIECE_INDEX = bytes(
+    PIECES.index(chr(code)) if chr(code) in PIECES else _NO_PIECE
+    for code in range(128)
+)
+
 def convert_algebraic_to_san(algebraic_notation):
     board = chess.Board()
+    push_san = board.push_san
+    board_fen = board.fen
     moves = algebraic_notation.split()
     fen_list = []
 
@@ -13,55 +31,49 @@ def convert_algebraic_to_san(algebraic_notation):
         move = move.replace("+", "").replace("#", "")
 
         try:
-            board.push_san(move)
-            fen_list.append(board.fen())
+            push_san(move)
+            fen_list.append(board_fen())
         except ValueError:
-            print(f"Invalid move: {move}")
+            logger.warning("Invalid move: %s", move)
             continue
 
     return fen_list
 
-def convert_fen_to_bitboard(fen):
-    bitboards = {
-        "p": 0,
-        "r": 0,
-        "n": 0,
-        "b": 0,
-        "q": 0,
-        "k": 0,
-    }
-
-    board_part = fen.split()[0]
-    rank = 0
-    file = 0
-
-    for char in board_part:
-        if char.isdigit():
-            file += int(char)
-        elif char in bitboards:
-            index = (rank * 8) + (7 - file)
-            bitboards[char] |= 1 << index
-            file += 1
-        elif char == "/":
-            rank += 1
-            file = 0
+def _fen_to_bitboards(fen):
+    bitboards = [0] * len(PIECES)
+
+    # index tracks (rank * 8) + (7 - file) for the square under the cursor.
+    row_start = 7
+    index = row_start
+
+    for code in fen.split()[0].encode("ascii"):
+        if code == _SLASH:
+            row_start += 8
+            index = row_start
+        elif _ZERO < code <= _NINE:
+            index -= code - _ZERO
+        else:
+            slot = _PIECE_INDEX[code]
+            if slot != _NO_PIECE:
+                bitboards[slot] |= 1 << index
+                index -= 1
 
     return bitboards
 
+def convert_fen_to_bitboard(fen):
+    return dict(zip(PIECES, _fen_to_bitboards(fen)))
+
 def serialize_position(fen):
-    bitboards = convert_fen_to_bitboard(fen)
+    return np.array(_fen_to_bitboards(fen), dtype=np.uint64)
 
-    serialized_array = []
-    for piece in ["p", "r", "n", "b", "q", "k"]:
-        serialized_array.append(bitboards[piece])
+def deserialize_position(serialized_array):
+    if isinstance(serialized_array, str):
+        serialized_array = [int(x) for x in serialized_array.strip('[]').split()]
+    bitboards = np.asarray(serialized_array, dtype=np.uint64)
 
-    return np.array(serialized_array, dtype=np.uint64)
+    # Big-endian bytes unpacked MSB-first give the same digits as format(bb, "064b").
+    bits = np.unpackbits(bitboards.astype(">u8").view(np.uint8))
+    rows = (bits + ord("0")).tobytes().decode("ascii")
 
-def deserialize_position(serialized_array):
-    bitboards = serialized_array.strip('[]').split(" ")
-    bitboards = [x for x in bitboards if x != '']
-    bitboards = [int(x) for x in bitboards]
-    pieces = ["p", "r", "n", "b", "q", "k"]
-    
-    bitboard_dict = {piece: format(bitboards[i], "064b") for i, piece in enumerate(pieces)}
+    bitboard_dict = {piece: rows[i * 64:(i + 1) * 64] for i, piece in enumerate(PIECES)}
     return bitboard_dict